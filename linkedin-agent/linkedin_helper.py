@@ -6,18 +6,23 @@ Env vars required
 LINKEDIN_ACCESS_TOKEN   token with scopes: w_member_social  openid  profile
 Optional
 LINKEDIN_VERSION_LOCK   pin a YYYYMM header instead of probing
+LINKEDIN_VERSION_CACHE  path of the on-disk good-month cache
+                        (default ~/.cache/linkedin_version)
 LOG_LEVEL               e.g. DEBUG / INFO  (default INFO)
 
-pip install requests python-dateutil
+pip install requests "httpx[http2]" orjson
 """
 from __future__ import annotations
 
-import json, os, urllib.parse, logging
+import asyncio, contextlib, json, os, re, time, logging
 from datetime import datetime, timezone
 from typing import Final
 
+import httpx
+import orjson
 import requests
-from dateutil.relativedelta import relativedelta   # tiny dep
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from opentelemetry import trace
 
 
@@ -25,58 +30,325 @@ from opentelemetry import trace
 log = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
+# span creation is not free (attribute validation + sampler evaluation);
+# skip it entirely when the SDK is switched off
+_OTEL_DISABLED: bool = os.getenv("OTEL_SDK_DISABLED", "").lower() in ("1", "true")
+
 # ─────────────────────────────  endpoints  ───────────────────────────
 POSTS_ENDPOINT:    Final[str] = "https://api.linkedin.com/rest/posts"
 USERINFO_ENDPOINT: Final[str] = "https://api.linkedin.com/v2/userinfo"
 
 _VERSION_CACHE: str | None = None          # module-wide cache (first good month)
 
+# scan raw bytes rather than resp.text – .text forces charset detection
+# plus a full decoded copy of the body just to look for one word
+_VER_RE: Final = re.compile(rb"version", re.I)
+
+# ─────────────────────────────  version cache (disk)  ────────────────
+_CACHE_PATH: Final[str] = os.path.expanduser(
+    os.getenv("LINKEDIN_VERSION_CACHE", "~/.cache/linkedin_version"))
+_CACHE_MAX_AGE: Final[float] = 30 * 24 * 3600   # re-probe after ~30 days
+
+
+def _load_version_cache() -> str | None:
+    """Best-effort read of the persisted good month; stale/broken → None."""
+    try:
+        with open(_CACHE_PATH) as fh:
+            entry = json.load(fh)
+        if time.time() - entry["ts"] > _CACHE_MAX_AGE:
+            return None
+        return entry["version"] or None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_version_cache(version: str) -> None:
+    """Atomically persist the good month so restarts skip the probe."""
+    try:
+        os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+        tmp = f"{_CACHE_PATH}.tmp"
+        with open(tmp, "w") as fh:
+            json.dump({"version": version, "ts": time.time()}, fh)
+        os.replace(tmp, _CACHE_PATH)
+    except OSError:
+        log.debug("could not persist version cache to %s", _CACHE_PATH)
+
+
+def _drop_version_cache() -> None:
+    """Remove the persisted month (it was rejected by a versioned call)."""
+    try:
+        os.remove(_CACHE_PATH)
+    except OSError:
+        pass
+
+
+_VERSION_CACHE = _load_version_cache()
+
+
+def _commit_version(version: str) -> None:
+    """Record a month that a *versioned* endpoint actually accepted.
+
+    The userinfo probe does not validate the header, so only real calls
+    against /rest/* are proof the month is good enough to persist.
+    """
+    global _VERSION_CACHE
+    if version != _VERSION_CACHE:
+        _save_version_cache(version)
+        _VERSION_CACHE = version
+
+
+def _build_versions(start_version: str | None, max_lookback: int,
+                    env_lock: str | None = None) -> list[str]:
+    """Candidate LinkedIn-Version months, newest first, cache month first.
+
+    An explicit lock wins outright: single candidate, no cache merge.
+    """
+    if env_lock:
+        return [env_lock]
+
+    first = start_version or datetime.now(timezone.utc).strftime("%Y%m")
+    y, m = int(first[:4]), int(first[4:])
+    versions = []
+    for i in range(max_lookback + 1):
+        mm = m - i
+        yy = y + (mm - 1) // 12
+        mm = (mm - 1) % 12 + 1
+        versions.append(f"{yy:04d}{mm:02d}")
+
+    if _VERSION_CACHE:
+        versions.insert(0, _VERSION_CACHE)
+        versions = list(dict.fromkeys(versions))
+    return versions
+
+# static shape of every text post; cloned (shallow) per call.  The
+# nested "distribution" dict is shared across posts – never mutate it
+# in place.
+_POST_TMPL: Final[dict] = {
+    "distribution": {
+        "feedDistribution": "MAIN_FEED",
+        "targetEntities": [],
+        "thirdPartyDistributionChannels": [],
+    },
+    "lifecycleState": "PUBLISHED",
+    "isReshareDisabledByAuthor": False,
+}
+
 # ─────────────────────────────  custom errors  ───────────────────────
 class LinkedInError(RuntimeError): ...
 class LinkedInVersionError(LinkedInError): ...
 class ExpiredTokenError(LinkedInError): ...
 
-# ─────────────────────────────  client  ──────────────────────────────
-class LinkedInClient:
+# ─────────────────────────────  shared client core  ──────────────────
+class _LinkedInClientBase:
+    """I/O-free logic shared by the sync and async clients.
+
+    Everything that could drift between the two transports – version
+    bookkeeping, header templates, payload/param building, response
+    classification, the ETag read cache – lives here; the subclasses
+    contribute only the HTTP calls.  The helpers taking a response work
+    on both requests and httpx responses (same status_code / content /
+    headers / json() surface).
+    """
+
     MAX_LOOKBACK   = 3               # months to probe downward
     DEFAULT_VIS    = "PUBLIC"
 
-    def __init__(self,
-                 access_token: str | None = None,
-                 start_version: str | None = None,
-                 session: requests.Session | None = None) -> None:
+    __slots__ = ("token", "_versions", "version", "_locked",
+                 "_base_headers", "_hdrs_ready", "_read_cache",
+                 "person_id", "author_urn", "first_name", "last_name")
 
+    def _init_core(self,
+                   access_token: str | None,
+                   start_version: str | None) -> None:
         self.token = access_token or os.getenv("LINKEDIN_ACCESS_TOKEN", "")
         if not self.token:
             raise LinkedInError("Set LINKEDIN_ACCESS_TOKEN or pass access_token=")
 
-        self._session = session or requests.Session()
-
         # ── build header probe list ──────────────────────────────────
         env_lock = os.getenv("LINKEDIN_VERSION_LOCK")
-        if env_lock:
-            self._versions = [env_lock]
-        else:
-            first = start_version or datetime.now(timezone.utc).strftime("%Y%m")
-            base  = datetime.strptime(first, "%Y%m")
-            self._versions = [
-                (base - relativedelta(months=i)).strftime("%Y%m")
-                for i in range(self.MAX_LOOKBACK + 1)
-            ]
+        self._locked = bool(env_lock)
+        self._versions = _build_versions(start_version, self.MAX_LOOKBACK,
+                                         env_lock)
+
+        # a pinned month always wins; otherwise trust the persisted
+        # month straight away – a later version-bad response strikes it
+        # and re-runs the probe
+        self.version: str | None = env_lock or _VERSION_CACHE
+
+        self._base_headers = {
+            "Authorization": f"Bearer {self.token}",
+            "X-Restli-Protocol-Version": "2.0.0",
+        }
+        self._hdrs_ready: dict | None = None   # full template, set on success
+        # count → (ETag, elements) so repeat polls can 304 instead of
+        # re-downloading + re-parsing the same feed page
+        self._read_cache: dict[int, tuple[str, list]] = {}
+
+    # ─────────────────────────────  profile  ─────────────────────────
+    def _apply_profile(self, profile: dict) -> None:
+        self.person_id  = profile["sub"]
+        self.first_name = profile.get("given_name", "")
+        self.last_name  = profile.get("family_name", "")
+        # set last: AsyncLinkedInClient.ensure_ready keys its fast path
+        # off author_urn
+        self.author_urn = f"urn:li:person:{self.person_id}"
+
+    # ─────────────────────────────  payload / params  ────────────────
+    def _post_payload(self, text: str, visibility: str | None) -> dict:
+        return {
+            **_POST_TMPL,
+            "author": self.author_urn,
+            "commentary": text,
+            "visibility": visibility or self.DEFAULT_VIS,
+        }
+
+    @staticmethod
+    def _log_dry_run(payload: dict) -> str:
+        # don't walk the payload if nobody will see the output
+        if log.isEnabledFor(logging.INFO):
+            log.info("%s", orjson.dumps(
+                payload, option=orjson.OPT_INDENT_2).decode())
+        return "dry_run"
+
+    def _read_params(self, count: int) -> dict:
+        return {
+            "q": "author",
+            # raw URN – the HTTP layer percent-encodes params exactly
+            # once; pre-quoting here would double-encode the colons
+            "author": self.author_urn,
+            "count": str(count),
+            "sortBy": "LAST_MODIFIED",
+        }
 
+    def _finish_read(self, count: int, cached: tuple[str, list] | None, r):
+        """Shared tail of try_read_latest."""
+        if r.status_code == 304 and cached:
+            return cached[1]
+        if r.status_code == 403:
+            log.warning("403 – token lacks r_member_social; read scope restricted.")
+            return None
+        r.raise_for_status()
+        elements = r.json().get("elements", [])
+        etag = r.headers.get("ETag")
+        if etag:
+            self._read_cache[count] = (etag, elements)
+        return elements
+
+    # ─────────────────────────────  version bookkeeping  ─────────────
+    def _probe_result(self, ver: str, hdrs: dict, resp) -> Exception | None:
+        """Classify one probe response; None means ver was accepted."""
+        if resp.status_code == 401 and b"LX401_Expired_Token" in resp.content:
+            raise ExpiredTokenError("LinkedIn access token expired")
+        if 200 <= resp.status_code < 300:
+            self.version = ver
+            self._hdrs_ready = hdrs
+            return None
+        log.debug("Version %s rejected", ver)
+        return LinkedInVersionError(
+            f"{resp.status_code} for {ver}: {resp.text[:120]}…")
+
+    def _all_versions_failed(self, last_ex) -> LinkedInVersionError:
+        attempted = ", ".join(self._versions)
+        return LinkedInVersionError(
+            f"All LinkedIn-Version headers failed: {attempted}\nLast error: {last_ex}"
+        )
+
+    def _request_headers(self, extra: dict) -> dict:
+        if self._hdrs_ready is None:
+            self._hdrs_ready = {**self._base_headers,
+                                "LinkedIn-Version": self.version}
+        return {**self._hdrs_ready, **extra} if extra else self._hdrs_ready
+
+    def _check_bad_version(self, resp) -> bool:
+        """Raise on an expired token; True if the response is version-bad."""
+        # token expiry shortcut
+        if resp.status_code == 401 and b"LX401_Expired_Token" in resp.content:
+            raise ExpiredTokenError("LinkedIn access token expired")
+        # bad LinkedIn-Version?  (400 / 404 / 426 + message).  Error
+        # bodies are small JSON; cap the scan at 512 bytes anyway.
+        return resp.status_code in (400, 404, 426) \
+            and _VER_RE.search(resp.content[:512]) is not None
+
+    def _accept_response(self, url: str, resp) -> None:
+        # a versioned endpoint accepted the month – now it is safe to
+        # persist it for the next restart.  A pinned month is never
+        # persisted: the pin is the operator's choice, not a discovery,
+        # and must not leak into later non-locked runs.
+        if not self._locked and url != USERINFO_ENDPOINT \
+                and resp.status_code < 500:
+            _commit_version(self.version)
+
+    def _strike_version(self, url: str, resp) -> None:
+        """Drop the rejected month and clear caches; raise when exhausted.
+
+        The probe endpoint does not enforce LinkedIn-Version, so a month
+        the versioned API rejects must be struck from the candidate list
+        – otherwise re-negotiation would hand the same month straight
+        back.
+        """
         global _VERSION_CACHE
-        if _VERSION_CACHE:
-            self._versions.insert(0, _VERSION_CACHE)
-            self._versions = list(dict.fromkeys(self._versions))
+        bad = self.version
+        log.debug("Version %s rejected for %s – striking it and "
+                  "re-negotiating", bad, url)
+        if bad in self._versions:
+            self._versions.remove(bad)
+        if bad == _VERSION_CACHE:
+            # don't let a rejected month survive a restart
+            _VERSION_CACHE = None
+            _drop_version_cache()
+        self.version = None
+        self._hdrs_ready = None
+        if not self._versions:
+            raise LinkedInVersionError(
+                f"All LinkedIn-Version headers failed; last: "
+                f"{resp.status_code} for {bad}: {resp.text[:120]}…")
+
+    @staticmethod
+    def _span(method: str, url: str):
+        # one span per attempt; the negotiated version is attached once
+        # the response is in
+        if _OTEL_DISABLED:
+            return contextlib.nullcontext()
+        return tracer.start_as_current_span(
+            "linkedin.http",
+            attributes={"http.method": method, "url": url},
+        )
 
-        self.version: str | None = None  # filled after first success
+    @staticmethod
+    def _extra_headers(kwargs: dict) -> dict:
+        return {k: v for k, v in (kwargs.pop("headers", {}) or {}).items()
+                if v is not None}
+
+
+# ─────────────────────────────  client  ──────────────────────────────
+class LinkedInClient(_LinkedInClientBase):
+    __slots__ = ("_session",)
+
+    def __init__(self,
+                 access_token: str | None = None,
+                 start_version: str | None = None,
+                 session: requests.Session | None = None) -> None:
+
+        self._init_core(access_token, start_version)
+        self._session = session or requests.Session()
+
+        # keep-alive pool sized for concurrent tool calls + transparent
+        # backoff on transient statuses (saves a TLS handshake per call)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET", "POST"]),
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.headers.update(self._base_headers)
 
         # ── profile discovery ────────────────────────────────────────
-        profile = self._fetch_profile()
-        self.person_id  = profile["sub"]
-        self.author_urn = f"urn:li:person:{self.person_id}"
-        self.first_name = profile.get("given_name", "")
-        self.last_name  = profile.get("family_name", "")
+        self._apply_profile(self._fetch_profile())
 
     # ─────────────────────────────  public API  ──────────────────────
     def preview(self, text: str) -> None:
@@ -86,41 +358,25 @@ class LinkedInClient:
     def post(self, text: str,
              visibility: str | None = None,
              dry_run: bool = False) -> str:
-        payload = {
-            "author": self.author_urn,
-            "commentary": text,
-            "visibility": visibility or self.DEFAULT_VIS,
-            "distribution": {
-                "feedDistribution": "MAIN_FEED",
-                "targetEntities": [],
-                "thirdPartyDistributionChannels": []
-            },
-            "lifecycleState": "PUBLISHED",
-            "isReshareDisabledByAuthor": False
-        }
+        payload = self._post_payload(text, visibility)
         if dry_run:
-            log.info(json.dumps(payload, indent=2))
-            return "dry_run"
+            return self._log_dry_run(payload)
 
-        r = self._request("POST", POSTS_ENDPOINT, json=payload)
+        # serialize once with orjson (C-implemented) instead of letting
+        # requests run stdlib json.dumps on every call
+        body = orjson.dumps(payload)
+        r = self._request("POST", POSTS_ENDPOINT, data=body,
+                          headers={"Content-Type": "application/json"})
         r.raise_for_status()
         return r.headers["x-restli-id"]
 
     def try_read_latest(self, count: int = 1):
-        params = {
-            "q": "author",
-            "author": urllib.parse.quote(self.author_urn, safe=""),
-            "count": str(count),
-            "sortBy": "LAST_MODIFIED",
-        }
+        cached = self._read_cache.get(count)
+        hdrs = {"If-None-Match": cached[0]} if cached else None
         r = self._request("GET", POSTS_ENDPOINT,
-                          params=params,
-                          headers={"Content-Type": None})
-        if r.status_code == 403:
-            log.warning("403 – token lacks r_member_social; read scope restricted.")
-            return None
-        r.raise_for_status()
-        return r.json().get("elements", [])
+                          params=self._read_params(count),
+                          headers=hdrs)
+        return self._finish_read(count, cached, r)
 
     # ─────────────────────────────  internals  ───────────────────────
     def _fetch_profile(self) -> dict:
@@ -128,56 +384,181 @@ class LinkedInClient:
         r.raise_for_status()
         return r.json()
 
+    def _negotiate_version(self) -> str:
+        """Probe candidate months with a cheap GET /v2/userinfo (no body).
+
+        Runs once per process (or after a strike); the winner is cached
+        on the instance and persisted only once a versioned endpoint
+        accepts it – the probe endpoint does not enforce the header.
+        """
+        last_ex: Exception | None = None
+
+        for ver in self._versions:
+            hdrs = {**self._base_headers, "LinkedIn-Version": ver}
+            try:
+                resp = self._session.get(USERINFO_ENDPOINT, headers=hdrs,
+                                         timeout=10)
+            except requests.RequestException as ex:
+                last_ex = ex
+                continue
+
+            last_ex = self._probe_result(ver, hdrs, resp)
+            if last_ex is None:
+                return ver
+
+        raise self._all_versions_failed(last_ex)
+
     def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        extra = self._extra_headers(kwargs)
+
+        while True:
+            if self.version is None:
+                self._negotiate_version()
+
+            hdrs = self._request_headers(extra)
+            with self._span(method, url) as span:
+                resp = self._session.request(
+                    method, url, headers=hdrs, timeout=30, **kwargs
+                )
+                if span is not None:
+                    span.set_attribute("linkedin.version", self.version)
+
+            if not self._check_bad_version(resp):
+                self._accept_response(url, resp)
+                return resp
+
+            # walk back to the next candidate month (raises if none left)
+            self._strike_version(url, resp)
+
+
+# ─────────────────────────────  async client  ────────────────────────
+class AsyncLinkedInClient(_LinkedInClientBase):
+    """httpx-based twin of :class:`LinkedInClient` for the asyncio service.
+
+    HTTP/2 multiplexes concurrent tool calls over one TLS connection, so
+    N in-flight posts/reads cost one handshake instead of N.  Construction
+    is cheap and does no I/O; the profile fetch and version negotiation
+    run lazily on the event loop at first use.
+    """
+
+    __slots__ = ("_client", "_probe_lock", "_ready_lock")
+
+    def __init__(self,
+                 access_token: str | None = None,
+                 start_version: str | None = None,
+                 client: httpx.AsyncClient | None = None) -> None:
+
+        self._init_core(access_token, start_version)
+        self._client = client            # created lazily on the running loop
+
+        # coalesce concurrent first-callers: only one runs the probe /
+        # profile fetch, the rest await its result
+        self._probe_lock = asyncio.Lock()
+        self._ready_lock = asyncio.Lock()
+
+        # filled by ensure_ready()
+        self.person_id:  str | None = None
+        self.author_urn: str | None = None
+        self.first_name = ""
+        self.last_name  = ""
+
+    # ─────────────────────────────  public API  ──────────────────────
+    async def ensure_ready(self) -> None:
+        """Fetch the profile once; later calls are free."""
+        if self.author_urn is not None:
+            return
+        async with self._ready_lock:
+            if self.author_urn is not None:   # lost the race – already done
+                return
+            self._apply_profile(await self._fetch_profile())
+
+    async def post(self, text: str,
+                   visibility: str | None = None,
+                   dry_run: bool = False) -> str:
+        await self.ensure_ready()
+        payload = self._post_payload(text, visibility)
+        if dry_run:
+            return self._log_dry_run(payload)
+
+        body = orjson.dumps(payload)
+        r = await self._request("POST", POSTS_ENDPOINT, content=body,
+                                headers={"Content-Type": "application/json"})
+        r.raise_for_status()
+        return r.headers["x-restli-id"]
+
+    async def try_read_latest(self, count: int = 1):
+        await self.ensure_ready()
+        cached = self._read_cache.get(count)
+        hdrs = {"If-None-Match": cached[0]} if cached else None
+        r = await self._request("GET", POSTS_ENDPOINT,
+                                params=self._read_params(count),
+                                headers=hdrs)
+        return self._finish_read(count, cached, r)
+
+    # ─────────────────────────────  internals  ───────────────────────
+    def _ensure_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=16),
+                timeout=30.0,
+                headers=self._base_headers,
+            )
+        return self._client
+
+    async def _fetch_profile(self) -> dict:
+        r = await self._request("GET", USERINFO_ENDPOINT)
+        r.raise_for_status()
+        return r.json()
+
+    async def _negotiate_version(self) -> str:
+        """Async mirror of LinkedInClient._negotiate_version."""
+        client = self._ensure_client()
         last_ex: Exception | None = None
 
         for ver in self._versions:
-            # build headers FIRST  ──────────────────────────────
-            hdrs = {k: v for k, v in (kwargs.pop("headers", {}) or {}).items()
-                    if v is not None}
-            hdrs.setdefault("Authorization", f"Bearer {self.token}")
-            hdrs.setdefault("LinkedIn-Version", ver)
-            hdrs.setdefault("X-Restli-Protocol-Version", "2.0.0")
-
-            # now record the span & make the request  ───────────
-            with tracer.start_as_current_span(
-                "linkedin.http",
-                attributes={
-                    "http.method": method,
-                    "url": url,
-                    "linkedin.version": ver,
-                },
-            ):
-                try:
-                    resp = self._session.request(
-                        method, url, headers=hdrs, timeout=30, **kwargs
-                    )
-                except requests.RequestException as ex:
-                    last_ex = ex
-                    continue
-
-            # token expiry shortcut
-            if resp.status_code == 401 and "LX401_Expired_Token" in resp.text:
-                raise ExpiredTokenError("LinkedIn access token expired")
-
-            # bad LinkedIn-Version?  (400 / 404 / 426 + message)
-            bad_ver = resp.status_code in (400, 404, 426) \
-                      and "version" in resp.text.lower()
-            if bad_ver:
-                last_ex = LinkedInVersionError(
-                    f"{resp.status_code} for {ver}: {resp.text[:120]}…")
-                log.debug("Version %s rejected for %s", ver, url)
+            hdrs = {**self._base_headers, "LinkedIn-Version": ver}
+            try:
+                resp = await client.get(USERINFO_ENDPOINT, headers=hdrs,
+                                        timeout=10)
+            except httpx.HTTPError as ex:
+                last_ex = ex
                 continue
 
-            # success – remember good month & return
-            global _VERSION_CACHE
-            _VERSION_CACHE = self.version = ver
-            return resp
+            last_ex = self._probe_result(ver, hdrs, resp)
+            if last_ex is None:
+                return ver
 
-        attempted = ", ".join(self._versions)
-        raise LinkedInVersionError(
-            f"All LinkedIn-Version headers failed: {attempted}\nLast error: {last_ex}"
-        )
+        raise self._all_versions_failed(last_ex)
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        extra = self._extra_headers(kwargs)
+
+        while True:
+            if self.version is None:
+                async with self._probe_lock:
+                    if self.version is None:  # lost the race – already done
+                        await self._negotiate_version()
+
+            hdrs = self._request_headers(extra)
+            with self._span(method, url) as span:
+                resp = await self._ensure_client().request(
+                    method, url, headers=hdrs, **kwargs
+                )
+                if span is not None:
+                    span.set_attribute("linkedin.version", self.version)
+
+            if not self._check_bad_version(resp):
+                self._accept_response(url, resp)
+                return resp
+
+            # walk back to the next candidate month (raises if none left)
+            self._strike_version(url, resp)
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
 
 # ─────────────────────────────  CLI demo  ────────────────────────────
@@ -192,4 +573,4 @@ if __name__ == "__main__":
 
     if input("Post this? [y/N] ").lower() == "y":
         urn = li.post(msg, visibility="LOGGED_IN")
-        log.info("Posted! URN: %s", urn)
\ No newline at end of file
+        log.info("Posted! URN: %s", urn)
@@ -1,35 +1,56 @@
 import asyncio
+import functools
+import hashlib
 import logging
-from meshagent.api import RequiredToolkit, RoomClient, ParticipantToken
+import threading
+import time
+from collections import OrderedDict
+import os
+
+from meshagent.api import RequiredToolkit, RoomClient
 from meshagent.api.services import ServiceHost
 from meshagent.agents.chat import ChatBot
-from meshagent.agents.mail import MailWorker, room_address
-from meshagent.openai import OpenAIResponsesAdapter
-from meshagent.openai.tools.responses_adapter import WebSearchTool
+from meshagent.agents.mail import MailWorker
 from meshagent.tools import ToolContext, TextResponse
 from meshagent.tools import Tool, Toolkit, RemoteToolkit
-from linkedin_helper import LinkedInClient
+from linkedin_helper import AsyncLinkedInClient, LinkedInError
 
-# from meshagent.otel import otel_config
+# Heavier leaf imports (OpenAI adapter, web-search tool, mail helpers)
+# are deferred into the classes that need them to keep cold start small.
 
 logging.basicConfig(level=logging.INFO)
 
-# otel_config(service_name="linkedin-service")
+if os.getenv("OTEL_ENABLED"):
+    from meshagent.otel import otel_config
+
+    otel_config(service_name="linkedin-service")
 log = logging.getLogger("linkedin")
 
 service = ServiceHost()  # defaults to port 8081
 
 
-def get_linkedin_client() -> LinkedInClient:
-    # singleton — created once, reused for the lifetime of the service
-    if not hasattr(get_linkedin_client, "_li"):
-        get_linkedin_client._li = LinkedInClient()
-    return get_linkedin_client._li
+_client_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _build_linkedin_client() -> AsyncLinkedInClient:
+    return AsyncLinkedInClient()
+
+
+def get_linkedin_client() -> AsyncLinkedInClient:
+    # singleton — created once, reused for the lifetime of the service.
+    # Construction is cheap (no I/O); the profile fetch runs lazily on
+    # the event loop. The lock guards first construction just in case a
+    # worker thread ever resolves the client too.
+    with _client_lock:
+        return _build_linkedin_client()
 
 
 class VerifyUserAuth(Tool):
     """Simple probe to make sure the token in env is valid."""
 
+    __slots__ = ()  # no per-instance state beyond the Tool base
+
     def __init__(self):
         super().__init__(
             name="verify-linkedin-auth",
@@ -46,6 +67,7 @@ class VerifyUserAuth(Tool):
     async def execute(self, context: ToolContext):
         try:
             li = get_linkedin_client()
+            await li.ensure_ready()
             log.info(
                 "linkedin.auth.ok",
                 extra={
@@ -66,6 +88,38 @@ class VerifyUserAuth(Tool):
 
 
 class PostTexttoLinkedIn(Tool):
+    __slots__ = ()  # dedupe state lives on the class, not instances
+
+    # Dedupe window shared by all instances: keys are hashes of
+    # (post_text, visibility), values are insertion timestamps.
+    _RECENT_MAX = 128
+    _RECENT_TTL = 3600.0  # seconds
+    _recent: "OrderedDict[bytes, float]" = OrderedDict()
+
+    @classmethod
+    def _dedupe_key(cls, post_text: str, visibility: str) -> bytes:
+        return hashlib.blake2b(
+            post_text.encode(), digest_size=16, key=visibility.encode()
+        ).digest()
+
+    @classmethod
+    def _is_recent(cls, key: bytes) -> bool:
+        now = time.monotonic()
+        while cls._recent:  # evict expired entries, oldest first
+            oldest, ts = next(iter(cls._recent.items()))
+            if now - ts > cls._RECENT_TTL:
+                cls._recent.popitem(last=False)
+            else:
+                break
+        return key in cls._recent
+
+    @classmethod
+    def _remember(cls, key: bytes) -> None:
+        cls._recent[key] = time.monotonic()
+        cls._recent.move_to_end(key)
+        while len(cls._recent) > cls._RECENT_MAX:
+            cls._recent.popitem(last=False)
+
     def __init__(self):
         super().__init__(
             name="post-text-to-linkedin",
@@ -82,15 +136,17 @@ class PostTexttoLinkedIn(Tool):
     async def execute(
         self, context: ToolContext, *, post_text: str, visibility: str = "PUBLIC"
     ):
-        li = get_linkedin_client()
-
         # Safety: make sure we never double-post identical text in one process
-        if hasattr(self, "_last_post") and self._last_post == post_text:
+        key = self._dedupe_key(post_text, visibility)
+        if self._is_recent(key):
             return TextResponse(text="Duplicate post suppressed.", success=False)
 
         try:
-            urn = li.post(post_text, visibility=visibility)
-            self._last_post = post_text
+            li = get_linkedin_client()
+            # httpx is async-native — the call multiplexes on the event
+            # loop, no worker-thread bounce needed
+            urn = await li.post(post_text, visibility=visibility)
+            self._remember(key)
             return TextResponse(text=f"Posted! URN: {urn}\nVisibility: {visibility}")
         except Exception as exc:
             return TextResponse(text=f"LinkedIn post failed: {exc}", success=False)
@@ -110,6 +166,9 @@ class LinkedInToolkit(RemoteToolkit):
 @service.path("/linkedinagent")
 class LinkedInAgent(ChatBot):
     def __init__(self):
+        from meshagent.openai import OpenAIResponsesAdapter
+        from meshagent.openai.tools.responses_adapter import WebSearchTool
+
         super().__init__(
             name="linkedin-agent",
             title="LinkedIn Agent",
@@ -133,6 +192,9 @@ class LinkedInAgent(ChatBot):
 @service.path("/linkedinmailagent")
 class LinkedInMailAgent(MailWorker):
     def __init__(self):
+        from meshagent.openai import OpenAIResponsesAdapter
+        from meshagent.openai.tools.responses_adapter import WebSearchTool
+
         super().__init__(
             name="linkedin-mail-agent",
             title="linkedin mail agent",
@@ -150,6 +212,9 @@ class LinkedInMailAgent(MailWorker):
         )
 
     async def start(self, *, room: RoomClient):
+        from meshagent.api import ParticipantToken
+        from meshagent.agents.mail import room_address
+
         parsed_token = ParticipantToken.from_jwt(room.protocol.token, validate=False)
         log.info(
             f"Send an email interact with your mailbot: {room_address(project_id=parsed_token.project_id, room_name=room.room_name)}"
@@ -157,9 +222,32 @@ class LinkedInMailAgent(MailWorker):
         return await super().start(room=room)
 
 
-log.info(f"running on port {service.port}")
-log.info("Starting service...")
+# Construct the singleton before serving so a missing/empty token
+# surfaces at boot instead of on the first user. A missing token only
+# logs a warning so the service still starts for non-LinkedIn tools.
+try:
+    get_linkedin_client()
+except LinkedInError as exc:
+    log.warning("LinkedIn client not ready at boot: %s", exc)
+
+log.info("starting service", extra={"port": service.port})
 for service_path in service.paths:
     log.info(f"  - {service_path.path}")
 
-asyncio.run(service.run())
+
+async def _warmup():
+    # Pay the profile fetch + version probe before the first user does,
+    # so the first tool call completes in local CPU time only. Failures
+    # only warn: ensure_ready() retries on the next tool call anyway.
+    try:
+        await get_linkedin_client().ensure_ready()
+    except Exception as exc:
+        log.warning("LinkedIn warm-up failed: %s", exc)
+
+
+async def _main():
+    await _warmup()
+    await service.run()
+
+
+asyncio.run(_main())
@@ -0,0 +1,35 @@
+"""Asserts the read-path query encodes each URN colon exactly once.
+
+Guards the double-encoding bug where a pre-quoted author URN was passed
+through the params kwarg and %3A became %253A on the wire.  The repo has
+no wider test suite; run this standalone with ``python -m pytest tests``
+or plain ``python tests/test_read_params.py``.
+"""
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+import requests
+
+from linkedin_helper import POSTS_ENDPOINT, _LinkedInClientBase
+
+
+def _prepared_url(author_urn: str) -> str:
+    client = object.__new__(_LinkedInClientBase)
+    client.author_urn = author_urn
+    req = requests.PreparedRequest()
+    req.prepare_url(POSTS_ENDPOINT, client._read_params(1))
+    return req.url
+
+
+def test_author_colons_encoded_exactly_once():
+    urn = "urn:li:person:AbC123"
+    query = _prepared_url(urn).split("?", 1)[1]
+    assert query.count("%3A") == urn.count(":")
+    assert "%253A" not in query
+
+
+if __name__ == "__main__":
+    test_author_colons_encoded_exactly_once()
+    print("ok")